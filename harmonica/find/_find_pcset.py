@@ -1,6 +1,6 @@
+from bisect import bisect_left
 from typing import Iterator
 
-from more_itertools import powerset
 from harmonica.pitch._scales import PitchClassSet
 
 
@@ -8,15 +8,25 @@ __all__ = ["find_pcset_supersets"]
 
 
 def find_pcset_supersets(pitch_class_set: PitchClassSet) -> Iterator[PitchClassSet]:
-    complement = set(range(pitch_class_set.modulus)) - set(
-        pitch_class_set.pitch_classes
-    )
-    pcset_powerset = powerset(complement)
-
-    for other_pitch_classes in pcset_powerset:
-        yield PitchClassSet(
-            pitch_classes=sorted(
-                pitch_class_set.pitch_classes + list(other_pitch_classes)
-            ),
-            modulus=pitch_class_set.modulus,
-        )
+    modulus = pitch_class_set.modulus
+    fixed = set(pitch_class_set.pitch_classes)
+    complement = [pc for pc in range(modulus) if pc not in fixed]
+
+    # Walk the subsets of the complement in Gray code order, so each superset differs
+    # from the last by one pitch class, toggled in place in a sorted list.
+    current = list(pitch_class_set.pitch_classes)
+
+    yield PitchClassSet._unchecked(current.copy(), modulus)
+
+    for step in range(1, 1 << len(complement)):
+        bit = (step & -step).bit_length() - 1
+        pitch_class = complement[bit]
+        index = bisect_left(current, pitch_class)
+
+        # The bit is set in the Gray code of `step` when the pitch class was just added.
+        if ((step ^ (step >> 1)) >> bit) & 1:
+            current.insert(index, pitch_class)
+        else:
+            del current[index]
+
+        yield PitchClassSet._unchecked(current.copy(), modulus)
@@ -2,21 +2,23 @@
 - Create Criterion subclasses for all criteria
 - Write more search algorithms to remove computational bottlenecks
 - Build out decision tree in `collect()`
-- Convert algorithms into iterators / generators for lazy evaluation
 """
 
 from __future__ import annotations
 from abc import abstractmethod
 from dataclasses import dataclass, field
-from itertools import combinations
-from typing import Generic, Optional, TypeVar
+from itertools import chain, combinations
+from typing import Generic, Hashable, Iterable, Iterator, Optional, TypeVar
 
 from harmonica.pitch import PitchClassSet
 from harmonica.pitch._pitchfunc import PitchFunc
-from harmonica.utility import powerset
+from harmonica.utility import cumsum
 from harmonica.pitch import PitchSet, PitchSetShape
 
-type PitchSets = set[PitchSet]
+type PitchSets = Iterator[PitchSet]
+
+# How many collect_list() results each finder keeps.
+_RESULT_CACHE_SIZE = 8
 
 
 class FindPitchSets:
@@ -26,15 +28,23 @@ class FindPitchSets:
 
     criteria: Criteria
 
+    # Results of recent collect_list() calls, keyed by Criteria.key() and ordered
+    # from least to most recently used. Pitch sets are stored as tuples since
+    # PitchSet is mutable.
+    _results: dict[tuple, tuple[tuple[int, ...], ...]]
+
     def __init__(self, min_pitch: int, max_pitch: int):
         assert min_pitch < max_pitch, "Min pitch must be less than max pitch."
 
         self.criteria = Criteria(min_pitch, max_pitch)
+        self._results = {}
 
     ## SETTING CRITERIA ##
 
     def cardinality(self, cardinality: int):
-        assert cardinality > 0, "Cardinality must be more than 0."
+        assert (
+            isinstance(cardinality, int) and cardinality > 0
+        ), "Cardinality must be an integer more than 0."
 
         if (
             self.criteria.max_card.value is not None
@@ -42,10 +52,14 @@ class FindPitchSets:
             self.criteria.max_card.value = None
         self.criteria.cardinality.value = cardinality
 
+        self.criteria.invalidate()
+
         return self
 
     def max_cardinality(self, max_size: int):
-        assert max_size > 0, "Max cardinality must be more than 0."
+        assert (
+            isinstance(max_size, int) and max_size > 0
+        ), "Max cardinality must be an integer more than 0."
 
         if (
             self.criteria.cardinality.value is not None
@@ -53,6 +67,8 @@ class FindPitchSets:
             self.criteria.cardinality.value = None
         self.criteria.max_card.value = max_size
 
+        self.criteria.invalidate()
+
         return self
 
     def has_shape(self, shape: PitchSetShape):
@@ -62,6 +78,8 @@ class FindPitchSets:
             self.criteria.has_subshape.value = None
         self.criteria.has_shape.value = shape
 
+        self.criteria.invalidate()
+
         return self
 
     def has_subshape(self, subshape: PitchSetShape):
@@ -71,76 +89,139 @@ class FindPitchSets:
             self.criteria.has_shape.value = None
         self.criteria.has_subshape.value = subshape
 
+        self.criteria.invalidate()
+
         return self
 
     def in_pcset(self, pcset: PitchClassSet):
         self.criteria.in_pcset.value = pcset
 
+        self.criteria.invalidate()
+
         return self
 
     ## COLLECTING RESULTS ##
 
     def collect(self) -> PitchSets:
         """Deploys the best algorithms given the current criteria settings
-        and returns a set of pitch sets."""
+        and lazily yields the pitch sets that meet them."""
 
         if self.criteria.has_shape.value:
-            return self._transpositions()
+            yield from self._iter_transpositions()
+        elif self.criteria.cardinality.value or self.criteria.max_card.value:
+            yield from self._iter_combinations()
         elif self.criteria.in_pcset.value:
-            return self._pcset_search()
+            yield from self._iter_pcset_search()
         else:
-            return self._brute_force()
+            yield from self._iter_brute_force()
+
+    def collect_list(self) -> list[PitchSet]:
+        """Returns every pitch set that meets the current criteria as a list.
+
+        Results are memoized per finder, so repeating a search with the same
+        criteria doesn't run it again."""
+
+        key = self.criteria.key()
+        results = self._results.pop(key, None)
+
+        if results is None:
+            results = tuple(tuple(pitch_set.pitches) for pitch_set in self.collect())
+            if len(self._results) >= _RESULT_CACHE_SIZE:
+                del self._results[next(iter(self._results))]
+
+        self._results[key] = results
+
+        return [PitchSet._unchecked(list(pitches)) for pitches in results]
 
     ## SEARCH ALGORITHMS ##
 
-    def _brute_force(self) -> PitchSets:
-        """Iterate through powerset of range, and then assert that criterion.filter(pset)
-        is true for all criteria."""
+    def _iter_brute_force(self) -> PitchSets:
+        """Iterate through every subset of the range encoded as a bitmask, and assert
+        that criterion.filter_bits(mask) is true for all criteria. Only the subsets
+        that pass are decoded into pitch sets."""
 
-        results: PitchSets = set()
         min_pitch: int = self.criteria.min_pitch
         max_pitch: int = self.criteria.max_pitch
+        # Bound to locals since they're looked up once per candidate.
+        filters = [criterion.filter_bits for criterion in self.criteria.ordered()]
+        unchecked = PitchSet._unchecked
+        decode = _decode_bitmask
 
-        for pitch_set in powerset(range(min_pitch, max_pitch + 1)):
-            pitch_set = PitchSet(list(pitch_set))
+        for mask in _iter_subsets_bitmask(max_pitch - min_pitch + 1):
+            if all(f(mask, min_pitch, max_pitch) for f in filters):
+                yield unchecked(decode(mask, min_pitch))
 
-            if self.criteria.filter(pitch_set):
-                results.add(pitch_set)
+    def _iter_combinations(self) -> PitchSets:
+        """Called when cardinality or max_cardinality is present, iterates through only
+        the combinations of the range with an allowed size, instead of the whole
+        powerset, and filters them using the remaining criteria.
 
-        return results
+        If in_pcset is present, the combinations are drawn from only the pitches in
+        range that belong to the pitch class set."""
 
-    def _pcset_search(self) -> PitchSets:
-        """Iterate through powerset of range of pitches inside of a pitch class set
-        and filter through elements using all present criteria."""
+        min_pitch: int = self.criteria.min_pitch
+        max_pitch: int = self.criteria.max_pitch
+        cardinality: Optional[int] = self.criteria.cardinality.value
+        max_card: Optional[int] = self.criteria.max_card.value
+        excludes = ["cardinality", "max_card"]
+        unchecked = PitchSet._unchecked
+
+        pitches_in_range: list[int] = list(range(min_pitch, max_pitch + 1))
+
+        if self.criteria.in_pcset.value is not None:
+            allowed = self.criteria.in_pcset.range_mask(min_pitch, max_pitch)
+            pitches_in_range = _decode_bitmask(allowed, min_pitch)
+            excludes.append("in_pcset")
+
+        filters = [
+            criterion.filter for criterion in self.criteria.ordered(excludes=excludes)
+        ]
+
+        if cardinality is not None:
+            sizes: Iterable[int] = [cardinality]
+        else:
+            assert max_card is not None
+            sizes = range(1, max_card + 1)
+
+        for size in sizes:
+            for pitches in combinations(pitches_in_range, size):
+                pitch_set = unchecked(list(pitches))
+
+                if all(f(pitch_set) for f in filters):
+                    yield pitch_set
+
+    def _iter_pcset_search(self) -> PitchSets:
+        """Iterate through every subset of the pitches in range that are inside of a
+        pitch class set, encoded as submasks of the pitch class set's range mask, and
+        filter through them using all present criteria."""
 
         assert self.criteria.in_pcset.value is not None
 
-        results: PitchSets = set()
-        pcset: PitchClassSet = self.criteria.in_pcset.value
         min_pitch: int = self.criteria.min_pitch
         max_pitch: int = self.criteria.max_pitch
-
-        pitches = [
-            pitch for pitch in range(min_pitch, max_pitch + 1) if pcset.contains(pitch)
+        filters = [
+            criterion.filter_bits
+            for criterion in self.criteria.ordered(excludes=["in_pcset"])
         ]
-        for pitch_set in powerset(pitches):
-            pitch_set = PitchSet(list(pitch_set))
+        unchecked = PitchSet._unchecked
+        decode = _decode_bitmask
 
-            if (
-                self.criteria.filter(pitch_set, excludes=["in_pcset"])
-                and pitch_set.pitches != []
-            ):
-                results.add(pitch_set)
+        allowed = self.criteria.in_pcset.range_mask(min_pitch, max_pitch)
 
-        return results
+        for mask in _iter_submasks(allowed):
+            if all(f(mask, min_pitch, max_pitch) for f in filters):
+                yield unchecked(decode(mask, min_pitch))
 
-    def _transpositions(self) -> PitchSets:
+    def _iter_transpositions(self) -> PitchSets:
         """Called when has_shape is present, transposes a pitch set stamped at
-        min_pitch until it's highest pitch exceeds max_pitch."""
+        min_pitch until it's highest pitch exceeds max_pitch.
+
+        Every criterion other than in_pcset is unaffected by transposition, so those
+        are checked once against the stamped pitch set. in_pcset is checked per
+        transposition against a lookup of which pitches in the range are allowed."""
 
         assert self.criteria.has_shape.value is not None
 
-        results: PitchSets = set()
         shape: PitchSetShape = self.criteria.has_shape.value
         min_pitch: int = self.criteria.min_pitch
         max_pitch: int = self.criteria.max_pitch
@@ -148,87 +229,247 @@ class FindPitchSets:
         transpositions = (max_pitch - min_pitch) - shape.span + 1
 
         if transpositions < 1:
-            return results
+            return
 
         pitch_set: PitchSet = shape.stamp(min_pitch)
 
-        for transposition in range(transpositions):
-            if self.criteria.filter(pitch_set + transposition, excludes=["has_shape"]):
-                results.add(pitch_set + transposition)
+        if not self.criteria.filter(pitch_set, excludes=["has_shape", "in_pcset"]):
+            return
+
+        offsets: Iterable[int] = range(transpositions)
 
-        return results
+        if self.criteria.in_pcset.value is not None:
+            # A transposition fits the pitch class set when every bit of the stamped
+            # set, shifted up by the offset, lands on an allowed pitch.
+            allowed = self.criteria.in_pcset.range_mask(min_pitch, max_pitch)
+            stamped = sum(1 << (pitch - min_pitch) for pitch in pitch_set)
+            offsets = [
+                offset
+                for offset in offsets
+                if (allowed >> offset) & stamped == stamped
+            ]
+
+        for offset in offsets:
+            yield PitchSet._unchecked([pitch + offset for pitch in pitch_set])
+
+
+def _iter_subsets_bitmask(n: int) -> Iterator[int]:
+    """Yields every non-empty subset of n elements, encoded as an integer whose
+    set bits mark the chosen elements."""
+
+    yield from range(1, 1 << n)
+
+
+def _iter_submasks(mask: int) -> Iterator[int]:
+    """Yields every non-empty subset of the set bits of mask, as a bitmask."""
+
+    submask = mask
+
+    while submask:
+        yield submask
+        submask = (submask - 1) & mask
+
+
+def _decode_bitmask(mask: int, offset: int) -> list[int]:
+    """Converts a subset bitmask into a sorted list of pitches, where bit i stands
+    for the pitch `offset + i`."""
+
+    pitches: list[int] = []
+
+    while mask:
+        low_bit = mask & -mask
+        pitches.append(offset + low_bit.bit_length() - 1)
+        mask ^= low_bit
+
+    return pitches
 
 
 T = TypeVar("T")
 
 
 class Criterion(Generic[T]):
-    value: Optional[T] = None
+    # Rough relative cost of filter(), used to evaluate cheap criteria first.
+    COST: int = 0
+
+    _value: Optional[T] = None
+
+    @property
+    def value(self) -> Optional[T]:
+        return self._value
+
+    @value.setter
+    def value(self, value: Optional[T]):
+        self._value = value
+
+        if value is not None:
+            self._prepare(value)
+
+    def _prepare(self, value: T):
+        """Precomputes anything filter() needs from a newly set value, so it isn't
+        recomputed for every candidate."""
+
+    def key(self) -> Hashable:
+        """Returns a hashable representation of the value, as the filters see it."""
+
+        return self.value
 
     @abstractmethod
     def filter(self, object) -> bool: ...
 
+    def filter_bits(self, bits: int, min_pitch: int, max_pitch: int) -> bool:
+        """Like filter(), for a pitch set encoded as a bitmask whose bit i stands for
+        the pitch `min_pitch + i`. Subclasses override this to work on the bitmask
+        directly; by default it is decoded into a pitch set."""
+
+        return self.filter(PitchSet._unchecked(_decode_bitmask(bits, min_pitch)))
+
 
 @dataclass
 class Cardinality(Criterion[int]):
+    COST = 1
+
     def filter(self, object: PitchSet) -> bool:
-        if object.cardinality == self.value:
-            return True
-        else:
-            return False
+        return object.cardinality == self.value
+
+    def filter_bits(self, bits: int, min_pitch: int, max_pitch: int) -> bool:
+        return bits.bit_count() == self.value
 
 
 @dataclass
 class MinCard(Criterion[int]):
+    COST = 1
+
+    _card: int = field(default=0, init=False, repr=False)
+
+    def _prepare(self, value: int):
+        self._card = value
+
     def filter(self, object: PitchSet) -> bool:
-        assert type(self.value) == int
+        return object.cardinality >= self._card
 
-        if object.cardinality >= self.value:
-            return True
-        else:
-            return False
+    def filter_bits(self, bits: int, min_pitch: int, max_pitch: int) -> bool:
+        return bits.bit_count() >= self._card
 
 
 @dataclass
 class MaxCard(Criterion[int]):
+    COST = 1
+
+    _card: int = field(default=0, init=False, repr=False)
+
+    def _prepare(self, value: int):
+        self._card = value
+
     def filter(self, object: PitchSet) -> bool:
-        assert type(self.value) == int
+        return object.cardinality <= self._card
 
-        if object.cardinality <= self.value:
-            return True
-        else:
-            return False
+    def filter_bits(self, bits: int, min_pitch: int, max_pitch: int) -> bool:
+        return bits.bit_count() <= self._card
 
 
 @dataclass
 class HasShape(Criterion[PitchSetShape]):
+    COST = 3
+
+    def key(self) -> Hashable:
+        return None if self.value is None else tuple(self.value.intervals)
+
     def filter(self, object: PitchSet) -> bool:
-        if object.shape == self.value:
-            return True
-        else:
-            return False
+        return object.shape == self.value
 
 
 @dataclass
 class HasSubshape(Criterion[PitchSetShape]):
+    COST = 10
+
+    # Distance of each pitch in the subshape above its lowest pitch.
+    _offsets: list[int] = field(default_factory=list, init=False, repr=False)
+
+    def _prepare(self, value: PitchSetShape):
+        self._offsets = cumsum(value.intervals)[1:]
+
+    def key(self) -> Hashable:
+        # The offsets are what the filters use, so they stay in step with the
+        # key even if the shape is edited after it's set.
+        return None if self.value is None else tuple(self._offsets)
+
     def filter(self, object: PitchSet) -> bool:
-        if object.shape == self:
-            return True
-        else:
+        if object.cardinality == 0:
             return False
 
+        lowest = object[0]
+
+        return self._contains_subshape(sum(1 << (pitch - lowest) for pitch in object))
+
+    def filter_bits(self, bits: int, min_pitch: int, max_pitch: int) -> bool:
+        return self._contains_subshape(bits)
+
+    def _contains_subshape(self, bits: int) -> bool:
+        # Bit i of `starts` stays set while the subshape stamped at bit i fits in the
+        # set, so whatever survives every shift is a pitch the subshape can start on.
+        starts = bits
+
+        for offset in self._offsets:
+            starts &= bits >> offset
+            if not starts:
+                return False
+
+        return starts != 0
+
 
 @dataclass
 class InPCSet(Criterion[PitchClassSet]):
+    COST = 5
+
+    # Bit i of the mask is set if pitch class i is in the pitch class set.
+    _mask: int = field(default=0, init=False, repr=False)
+    _modulus: int = field(default=1, init=False, repr=False)
+    # The last range mask built, keyed by its pitch bounds.
+    _range: tuple[int, int, int] = field(default=(0, -1, 0), init=False, repr=False)
+
+    def _prepare(self, value: PitchClassSet):
+        self._mask = sum(1 << pitch_class for pitch_class in value.pitch_classes)
+        self._modulus = value.modulus
+        self._range = (0, -1, 0)
+
+    def key(self) -> Hashable:
+        # The mask is what the filters use, so it stays in step with the key even
+        # if the pitch class set is edited after it's set.
+        return None if self.value is None else (self._mask, self._modulus)
+
     def filter(self, object: PitchSet) -> bool:
-        assert self.value is not None
+        mask, modulus = self._mask, self._modulus
 
         for pitch in object:
-            if not self.value.contains(pitch):
+            if not (mask >> (pitch % modulus)) & 1:
                 return False
 
         return True
 
+    def filter_bits(self, bits: int, min_pitch: int, max_pitch: int) -> bool:
+        return bits & ~self.range_mask(min_pitch, max_pitch) == 0
+
+    def range_mask(self, min_pitch: int, max_pitch: int) -> int:
+        """Returns a bitmask over the pitches from min_pitch to max_pitch, where bit i
+        is set if the pitch `min_pitch + i` is in the pitch class set."""
+
+        if self._range[:2] == (min_pitch, max_pitch):
+            return self._range[2]
+
+        modulus = self._modulus
+        range_mask = 0
+
+        # Step through each pitch class's pitches in the range directly, rather than
+        # testing every pitch in the range for membership.
+        for pitch_class in _decode_bitmask(self._mask, 0):
+            first = (pitch_class - min_pitch) % modulus
+            for i in range(first, max_pitch - min_pitch + 1, modulus):
+                range_mask |= 1 << i
+
+        self._range = (min_pitch, max_pitch, range_mask)
+
+        return range_mask
+
 
 @dataclass
 class Criteria:
@@ -241,6 +482,11 @@ class Criteria:
     has_subshape: HasSubshape = field(default_factory=HasSubshape)
     in_pcset: InPCSet = field(default_factory=InPCSet)
 
+    # Results of ordered(), keyed by excludes. Cleared by invalidate().
+    _ordered: dict[tuple[str, ...], list[Criterion]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def get(self, excludes=None) -> dict[str, Criterion]:
         """Returns a dict containing criterion objects which have non-None values and
         aren't the pitch bounds."""
@@ -249,18 +495,44 @@ class Criteria:
         return {
             name: criterion
             for name, criterion in vars(self).items()
-            if name != "min_pitch"
-            and name != "max_pitch"
+            if isinstance(criterion, Criterion)
             and criterion.value is not None
             and name not in excludes
         }
 
+    def invalidate(self):
+        """Clears cached results of ordered(). Must be called after a criterion's
+        value changes."""
+
+        self._ordered.clear()
+
+    def key(self) -> tuple:
+        """Returns a hashable signature of the pitch bounds and criterion values.
+        Criteria with equal keys are met by the same pitch sets."""
+
+        return (self.min_pitch, self.max_pitch) + tuple(
+            criterion.key()
+            for criterion in vars(self).values()
+            if isinstance(criterion, Criterion)
+        )
+
+    def ordered(self, excludes=None) -> list[Criterion]:
+        """Returns the criterion objects from get(), cheapest to evaluate first, so
+        that filtering can reject a pitch set before reaching the expensive ones."""
+
+        key = tuple(excludes) if excludes is not None else ()
+
+        if key not in self._ordered:
+            self._ordered[key] = sorted(
+                self.get(excludes).values(), key=lambda criterion: criterion.COST
+            )
+
+        return self._ordered[key]
+
     def filter(self, pitch_set: PitchSet, excludes: list[str] = []) -> bool:
         """Returns True if pitch set passes criteria. Ignores criteria in excludes list."""
 
-        return all(
-            [criterion.filter(pitch_set) for criterion in self.get(excludes).values()]
-        )
+        return all(criterion.filter(pitch_set) for criterion in self.ordered(excludes))
 
 
 def find_nearby_psets_in_scale(
@@ -268,24 +540,25 @@ def find_nearby_psets_in_scale(
     target_scale: PitchFunc,
     proximity: int,
     size_bounds: tuple[int, int],
-) -> list[PitchSet]:
+) -> PitchSets:
     """
-    Returns a list of pitch sets that are in the proximity of a source pitch set
+    Lazily yields the pitch sets that are in the proximity of a source pitch set
     and sit in a target scale.
     """
 
-    target_pitches = []
-
-    for p in source_pset:
-        for tp in target_scale.in_range(p - proximity, p + proximity):
-            if tp not in target_pitches:
-                target_pitches.append(tp)
-
-    proximal_psets = []
+    # Sorted, so every combination is already a valid pitch set.
+    target_pitches = sorted(
+        {
+            tp
+            for p in source_pset
+            for tp in target_scale.in_range(p - proximity, p + proximity)
+        }
+    )
 
-    for k in range(size_bounds[0], size_bounds[1] + 1):
-        proximal_psets.extend(
-            [PitchSet(list(x)) for x in combinations(target_pitches, k)]
-        )
+    unchecked = PitchSet._unchecked
 
-    return proximal_psets
+    for x in chain.from_iterable(
+        combinations(target_pitches, k)
+        for k in range(size_bounds[0], size_bounds[1] + 1)
+    ):
+        yield unchecked(list(x))
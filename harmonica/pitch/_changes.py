@@ -31,8 +31,11 @@ class PitchSetSeq:
     def transpose(self, amount: int):
         """Transposes all the pitch sets in the sequence."""
 
-        for pitch_set in self.pitch_sets:
-            pitch_set.transpose(amount)
+        if amount:
+            for pitch_set in self.pitch_sets:
+                pitch_set.transpose(amount)
+
+        return self
 
     ## ANALYZE ##
 
@@ -44,16 +47,7 @@ class PitchSetSeq:
 
         cardinality = self.pitch_sets[0].cardinality
 
-        if all([x.cardinality == cardinality for x in self.pitch_sets]):
-            return True
-        else:
-            return False
-
-    @property
-    def len(self) -> int:
-        """Returns the length of the sequence of pitch sets."""
-
-        return len(self.pitch_sets)
+        return all(x.cardinality == cardinality for x in self.pitch_sets)
 
     ## PREVIEW ##
 
@@ -68,14 +62,16 @@ class PitchSetSeq:
         if bass:
             transpose = bass - self[0][0]
 
-        note_clip = NoteClip([]).set_program(program)
+        notes = []
         onset = Mixed(0)
 
-        for pitch_set in self:
+        for pitch_set in self.pitch_sets:
             for pitch in pitch_set:
-                note_clip.add_event(
+                notes.append(
                     Note(pitch=pitch + transpose, onset=onset, duration=duration)
                 )
             onset += duration
 
+        note_clip = NoteClip(notes).set_program(program)
+
         Clip([note_clip]).preview()
@@ -10,7 +10,7 @@ from harmonica.utility import cumsum, diff
 __all__ = ["PitchSeq", "PitchSeqShape", "PCSequence", "PitchSeqSet"]
 
 
-@dataclass
+@dataclass(slots=True)
 class PitchSeq:
     """A sequence of pitches used to represent a melody."""
 
@@ -37,7 +37,8 @@ class PitchSeq:
     def transpose(self, amount: int):
         """Transposes the pitch sequence."""
 
-        self.pitches = [pitch + amount for pitch in self.pitches]
+        if amount:
+            self.pitches = [pitch + amount for pitch in self.pitches]
 
         return self
 
@@ -53,23 +54,12 @@ class PitchSeq:
 
         assert amount > 0, "Repeat amount must be positive."
 
-        new_pitches = []
-
-        for i in range(amount):
-            new_pitches.extend(self.pitches)
-
-        self.pitches = new_pitches
+        self.pitches = self.pitches * amount
 
         return self
 
     ## ANALYZE ##
 
-    @property
-    def length(self) -> int:
-        """Returns the length of the pitch sequence."""
-
-        return len(self.pitches)
-
     @property
     def shape(self) -> PitchSeqShape:
         """Returns the sequence of intervals between successive pitches in the sequence."""
@@ -108,7 +98,7 @@ class PitchSeq:
         Clip([note_clip]).preview()
 
 
-@dataclass
+@dataclass(slots=True)
 class PitchSeqShape:
     """A sequence of intervals used to describe the difference between successive
     pitches in a pitch sequence."""
@@ -132,16 +122,8 @@ class PitchSeqShape:
 
         return PitchSeq(cumsum(self.intervals, starting_pitch))
 
-    ## ANALYZE ##
-
-    @property
-    def length(self) -> int:
-        """Returns the length of the interval sequence."""
-
-        return len(self.intervals)
 
-
-@dataclass
+@dataclass(slots=True)
 class PCSequence:
     """A sequence of pitch classes used to represent a whole class of pitch sequences."""
 
@@ -154,7 +136,7 @@ class PCSequence:
 
     def __post_init__(self):
         assert all(
-            [0 <= pitch_class < self.modulus for pitch_class in self.pitch_classes]
+            0 <= pitch_class < self.modulus for pitch_class in self.pitch_classes
         ), "Pitch classes must be between 0 and modulus - 1."
 
         assert self.modulus > 0, "Modulus must be positive."
@@ -165,16 +147,8 @@ class PCSequence:
     def __len__(self) -> int:
         return len(self.pitch_classes)
 
-    ## ANALYZE ##
-
-    @property
-    def length(self) -> int:
-        """Returns the length of the pitch class sequence."""
-
-        return len(self.pitch_classes)
-
 
-@dataclass
+@dataclass(slots=True)
 class PitchSeqSet:
     """A set of pitch sequences, representing a polyphony of voices."""
 
@@ -192,8 +166,11 @@ class PitchSeqSet:
     def transpose(self, amount: int):
         """Transposes all the pitch sequences in the set."""
 
-        for pitch_sequence in self.pitch_sequences:
-            pitch_sequence.transpose(amount)
+        if amount:
+            for pitch_sequence in self.pitch_sequences:
+                pitch_sequence.transpose(amount)
+
+        return self
 
     ## ANALYZE ##
 
@@ -203,12 +180,9 @@ class PitchSeqSet:
         if len(self.pitch_sequences) == 0:
             return True
 
-        length = self.pitch_sequences[0].length
+        length = len(self.pitch_sequences[0])
 
-        if all([x.length == length for x in self.pitch_sequences]):
-            return True
-        else:
-            return False
+        return all(len(x) == length for x in self.pitch_sequences)
 
     @property
     def size(self) -> int:
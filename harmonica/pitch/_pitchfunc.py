@@ -1,7 +1,10 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
+from functools import lru_cache
 import math
-from typing import Iterable, overload
+from typing import Callable, Iterable, Optional, overload
+
+from harmonica.utility._pattern_eval import compile_eval, eval_range
 
 
 @dataclass
@@ -14,6 +17,21 @@ class PitchFunc:
     pattern: list[int]
     transposition: int = field(default=0)
 
+    # The pattern the caches below were derived from. The pattern is a public list
+    # that can be reassigned or edited in place, so the caches are checked against
+    # it on every read.
+    _cached_pattern: Optional[tuple[int, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Residue map derived from the pattern, shared between equal patterns.
+    _rmap_cache: Optional[tuple[int, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Single-input evaluator specialized to the pattern.
+    _eval_fn: Optional[Callable[[int], int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @overload
     def __call__(self, n: int) -> int: ...
     @overload
@@ -42,10 +60,20 @@ class PitchFunc:
         """Composes this pitch function with another."""
 
         transposition = self.eval(other.eval(0))
+        # After `a` periods of the inner function its output has moved by
+        # `a * other.modulus`, which is a whole number of this function's periods
+        # once `a = self.period / gcd(self.period, other.modulus)`.
         size = self.period * other.period // math.gcd(self.period, other.modulus)
+
+        # Evaluate the outer function inline, folding in the subtraction of the
+        # new transposition, instead of building an intermediate list.
+        rmap = self._rmap
+        period = self.period
+        modulus = self.modulus
+        offset = self.transposition - transposition
         pattern = [
-            chroma - transposition
-            for chroma in self.eval(other.eval(range(1, size + 1)))
+            (m // period) * modulus + rmap[m % period] + offset
+            for m in other.eval(range(1, size + 1))
         ]
 
         return PitchFunc(pattern, transposition)
@@ -74,61 +102,65 @@ class PitchFunc:
 
         if isinstance(n, int):
             return self._eval(n)
+        if isinstance(n, range) and n.step == 1 and n:
+            return eval_range(
+                self._rmap, self.modulus, self.transposition, n.start, n.stop
+            )
         if isinstance(n, Iterable):
-            return [self._eval(i) for i in n]
+            # Look everything up once rather than per input.
+            rmap = self._rmap
+            period = self.period
+            modulus = self.modulus
+            transposition = self.transposition
+
+            # Floor division and modulo inline run faster here than divmod and
+            # append in a loop.
+            return [
+                (i // period) * modulus + rmap[i % period] + transposition for i in n
+            ]
         return None
 
     def _eval(self, n: int) -> int:
-        r = n % len(self.pattern)
-        q = int((n - r)) / self.period
-
         # Returns quotient * modulus + remainder + transposition
-        return int(q * self.modulus + self._rmap[r]) + self.transposition
+        return self._evaluator()(n) + self.transposition
+
+    def _evaluator(self) -> Callable[[int], int]:
+        self._check_caches()
+
+        if self._eval_fn is None:
+            self._eval_fn = compile_eval(self._rmap, self.period, self.modulus)
+
+        return self._eval_fn
 
     def in_range(self, lower: int, upper: int) -> list[int]:
         """
         Returns list of all values f(x) such that lower <= f(x) <= upper.
         """
 
-        def get_bounds(f: PitchFunc, start: int, stop: int) -> tuple:
-            lower_bound = 0
-            upper_bound = 0
-
-            x = 0
-
-            if start <= f.eval(x):
-                while True:
-                    x -= 1
-                    if not start <= f.eval(x):
-                        lower_bound = x + 1
-                        break
-            else:
-                while True:
-                    x += 1
-                    if start <= f.eval(x):
-                        lower_bound = x
-                        break
-
-            x = 0
-
-            if f.eval(x) < stop:
-                while True:
-                    x += 1
-                    if not f.eval(x) <= stop:
-                        upper_bound = x - 1
-                        break
-            else:
-                while True:
-                    x += 1
-                    if f.eval(x) <= stop:
-                        upper_bound = x
-                        break
-
-            return (lower_bound, upper_bound)
-
-        low, high = get_bounds(self, lower, upper)
-
-        return self.eval(range(low, high + 1))
+        assert self.modulus > 0, "Pitch function must have a positive modulus."
+
+        rmap = self._rmap
+        period = self.period
+        modulus = self.modulus
+        transposition = self.transposition
+
+        # The inputs with residue r map to q * modulus + rmap[r] + transposition, so
+        # solve for the first q above lower and the last q below upper in each
+        # residue class, then take the outermost inputs across the classes.
+        low = min(
+            -((transposition + offset - lower) // modulus) * period + r
+            for r, offset in enumerate(rmap)
+        )
+        high = max(
+            ((upper - transposition - offset) // modulus) * period + r
+            for r, offset in enumerate(rmap)
+        )
+
+        return [
+            pitch
+            for pitch in self.eval(range(low, high + 1))
+            if lower <= pitch <= upper
+        ]
 
     @property
     def modulus(self) -> int:
@@ -143,5 +175,29 @@ class PitchFunc:
         return len(self.pattern)
 
     @property
-    def _rmap(self) -> list[int]:  # residue map
-        return [0] + self.pattern[:-1]
+    def _rmap(self) -> tuple[int, ...]:  # residue map
+        self._check_caches()
+
+        if self._rmap_cache is None:
+            self._rmap_cache = _residue_map(tuple(self.pattern))
+
+        return self._rmap_cache
+
+    def _check_caches(self):
+        """Drops the caches derived from the pattern if the pattern has changed
+        since they were built."""
+
+        pattern = tuple(self.pattern)
+
+        if pattern != self._cached_pattern:
+            self._cached_pattern = pattern
+            self._rmap_cache = None
+            self._eval_fn = None
+
+
+@lru_cache(maxsize=512)
+def _residue_map(pattern: tuple[int, ...]) -> tuple[int, ...]:
+    """Returns the residue map of a pattern. Cached so that pitch functions built
+    from the same pattern, like the modes of one scale, share a single table."""
+
+    return (0,) + pattern[:-1]
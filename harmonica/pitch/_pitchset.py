@@ -1,5 +1,6 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from itertools import pairwise
 from math import ceil
 from typing import TYPE_CHECKING, Optional
 
@@ -11,7 +12,7 @@ if TYPE_CHECKING:
     from harmonica.time import NoteClip
 
 
-@dataclass
+@dataclass(slots=True)
 class PitchSet:
     """A set of pitches used to represent a specific voicing of a chord."""
 
@@ -19,15 +20,35 @@ class PitchSet:
 
     pitches: list[int]
 
+    # Lazily computed interval spectrum, along with the pitches it was derived from.
+    # The pitches are a public list that can be edited in place, so the cache is
+    # checked against them on every read.
+    _interval_spectrum: Optional[tuple[tuple[int, ...], ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cache_key: Optional[tuple[int, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     ## MAGIC METHODS ##
 
     def __post_init__(self):
-        assert self.pitches == list(
-            sorted(set(self.pitches))
-        ), "Pitches in pitch set must be unique."
-        assert self.pitches == list(
-            sorted(self.pitches)
-        ), "Pitches in pitch set must be sorted."
+        # Strictly ascending implies both sorted and unique.
+        assert all(
+            a < b for a, b in pairwise(self.pitches)
+        ), "Pitches in pitch set must be sorted and unique."
+
+    @classmethod
+    def _unchecked(cls, pitches: list[int]) -> PitchSet:
+        """Constructs a pitch set without validating its pitches. Only for callers
+        that already guarantee the pitches are sorted and unique."""
+
+        pset = cls.__new__(cls)
+        pset.pitches = pitches
+        pset._interval_spectrum = None
+        pset._cache_key = None
+
+        return pset
 
     def __getitem__(self, item: int) -> int:
         return self.pitches[item]
@@ -42,53 +63,52 @@ class PitchSet:
         return len(self.pitches)
 
     def __sub__(self, amount: int) -> PitchSet:
-        pset = PitchSet(self.pitches)
-        pset.transpose(-amount)
-
-        return pset
+        return self.get_transposed(-amount)
 
     def __mod__(self, modulus: int) -> PitchClassSet:
         return self.classify(modulus)
 
     def __hash__(self):
-        return hash(tuple(pitch for pitch in self.pitches))
+        return hash(tuple(self.pitches))
 
     ## TRANSFORM ##
 
     def transpose(self, amount: int):
         """Transposes the pitch set."""
 
-        for i in range(len(self.pitches)):
-            self.pitches[i] += amount
+        if amount:
+            self.pitches = [pitch + amount for pitch in self.pitches]
 
         return self
 
     def get_transposed(self, amount: int) -> PitchSet:
         """Returns a transposed pitch set."""
 
-        return PitchSet([pitch + amount for pitch in self.pitches])
+        pset = PitchSet._unchecked([pitch + amount for pitch in self.pitches])
+
+        if self._cache_key == tuple(self.pitches):
+            # Transposing doesn't change the interval spectrum.
+            pset._interval_spectrum = self._interval_spectrum
+            pset._cache_key = tuple(pset.pitches)
+
+        return pset
 
     def normalize(self):
         """Transposes the pitch set so the lowest pitch is 0."""
 
-        self.transpose(-min(self.pitches))
+        self.transpose(-self.pitches[0])
 
         return self
 
     def get_normalized(self) -> PitchSet:
         """Returns a normalized pitch set."""
 
-        return PitchSet([pitch - min(self.pitches) for pitch in self.pitches])
+        return self.get_transposed(-self.pitches[0])
 
     def harmonize(self, target_pitch: int, target_pitch_index: int):
         """Transposes the pitch set so the pitch at `target_pitch_index` is equal to `target_pitch`."""
 
-        self.pitches = [
-            pitch + (target_pitch - self.pitches[target_pitch_index])
-            for pitch in self.pitches
-        ]
-
-        return self
+        return self.transpose(target_pitch - self.pitches[target_pitch_index])
 
     def get_harmonized(self, target_pitch: int, target_pitch_index: int):
         """Returns transposed pitch set. Immutable variant of `harmonize()`."""
@@ -99,9 +119,23 @@ class PitchSet:
         up or down in register."""
 
         new_mod = modulus * ceil(self.span / modulus)
-        pcset = self.classify(new_mod)
-        func = pcset.scale_function(min(pcset.pitch_classes))
-        self.pitches = [func(func.index(pitch) + amount) for pitch in self.pitches]
+
+        # Index the pitches in the scale formed by their pitch classes, starting
+        # from the lowest pitch class, shift the indexes and map them back.
+        pitch_classes = sorted({pitch % new_mod for pitch in self.pitches})
+        lowest = pitch_classes[0]
+        residues = [pc - lowest for pc in pitch_classes]
+        positions = {residue: i for i, residue in enumerate(residues)}
+        size = len(residues)
+
+        inverted: list[int] = []
+
+        for pitch in self.pitches:
+            octave, residue = divmod(pitch - lowest, new_mod)
+            octave, i = divmod(octave * size + positions[residue] + amount, size)
+            inverted.append(octave * new_mod + residues[i] + lowest)
+
+        self.pitches = inverted
 
         return self
 
@@ -110,11 +144,9 @@ class PitchSet:
     def classify(self, modulus: int = 12) -> PitchClassSet:
         """Yields the pitch class set corresponding to this pitch set with respect to a given modulus."""
 
-        pcset = [pitch % modulus for pitch in self.pitches]
-        pcset = list(set(pcset))
-        pcset.sort()
+        pitch_classes = sorted({pitch % modulus for pitch in self.pitches})
 
-        return PitchClassSet(pcset, modulus)
+        return PitchClassSet._unchecked(pitch_classes, modulus)
 
     ## ANALYZE ##
 
@@ -136,7 +168,8 @@ class PitchSet:
     def span(self) -> int:
         """The difference between the highest and lowest pitches in the set."""
 
-        return max(self.pitches) - min(self.pitches)
+        # Pitches are sorted, so the ends are the extremes.
+        return self.pitches[-1] - self.pitches[0]
 
     @property
     def interval_spectrum(self) -> list[list[int]]:
@@ -148,18 +181,30 @@ class PitchSet:
 
         This accounts for every interval present in the pitch set."""
 
-        if self.cardinality <= 1:
-            return []
+        self._check_caches()
+
+        if self._interval_spectrum is None:
+            pitches = self.pitches
+
+            # Pairing the pitches with themselves offset by `jump` gives every
+            # interval spanning that many steps. Stored as tuples, since the cache
+            # is shared with transposed copies of the set.
+            self._interval_spectrum = tuple(
+                tuple(high - low for low, high in zip(pitches, pitches[jump:]))
+                for jump in range(1, len(pitches))
+            )
+
+        return [list(intervals) for intervals in self._interval_spectrum]
 
-        spectrum: list[list[int]] = []
+    def _check_caches(self):
+        """Drops the cached interval spectrum if the pitches have changed since it
+        was computed."""
 
-        for jump in range(1, self.cardinality):
-            diffs: list[int] = []
-            for pos in range(self.cardinality - jump):
-                diffs.append(self.pitches[pos + jump] - self.pitches[pos])
-            spectrum.append(diffs)
+        key = tuple(self.pitches)
 
-        return spectrum
+        if key != self._cache_key:
+            self._cache_key = key
+            self._interval_spectrum = None
 
     ## PREVIEW ##
 
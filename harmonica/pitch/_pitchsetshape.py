@@ -1,3 +1,4 @@
+from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -7,7 +8,7 @@ if TYPE_CHECKING:
     from harmonica.pitch import PitchSet
 
 
-@dataclass
+@dataclass(slots=True)
 class PitchSetShape:
     """A sequence of positive intervals that describes the intervallic shape of a pitch set."""
 
@@ -19,21 +20,25 @@ class PitchSetShape:
 
     def __post_init__(self):
         assert not any(
-            [interval <= 0 for interval in self.intervals]
+            interval <= 0 for interval in self.intervals
         ), "Intervals in pitch set shape must be greater than 0."
 
     def __getitem__(self, item: int) -> int:
         # Access pitch set shape like a list for convenience.
         return self.intervals[item]
 
+    def __hash__(self):
+        return hash(tuple(self.intervals))
+
     ## GENERATE ##
 
-    def stamp(self, lowest_pitch: int) -> "PitchSet":
+    def stamp(self, lowest_pitch: int) -> PitchSet:
         """Constructs a pitch set using the shape of intervals."""
 
         from harmonica.pitch import PitchSet
 
-        return PitchSet(cumsum(self.intervals, lowest_pitch))
+        # Positive intervals always stack into strictly ascending pitches.
+        return PitchSet._unchecked(cumsum(self.intervals, lowest_pitch))
 
     ## ANALYZE
 
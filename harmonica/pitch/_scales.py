@@ -1,6 +1,7 @@
 from __future__ import annotations
-from itertools import combinations
-from typing import Iterable, Optional, overload
+from bisect import bisect_left
+from itertools import pairwise
+from typing import Callable, Iterable, Optional, overload
 from dataclasses import dataclass, field
 import math
 
@@ -8,12 +9,14 @@ from harmonica.utility import (
     cumsum,
     cycle_cumsum,
     cycle_diff,
+    diff,
     repeating_subseq,
     rotate,
 )
+from harmonica.utility._pattern_eval import compile_eval, eval_range
 
 
-@dataclass
+@dataclass(slots=True)
 class PitchClassSet:
     """A set of pitch classes used to represent a scale, without respect to a root.
 
@@ -26,22 +29,63 @@ class PitchClassSet:
     modulus: int
     root: Optional[int] = field(default=None)
 
+    # Position of each pitch class, for membership tests and index lookups.
+    _pc_index: Optional[dict[int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Pitch classes as the set bits of an int.
+    _bitmask: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Lazily computed interval vector.
+    _interval_vector: Optional[tuple[int, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Lazily computed structure, read from the root.
+    _structure: Optional[ScaleStructure] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # The pitch classes, root and modulus the caches above were derived from. They
+    # are public and can be reassigned or edited in place, so the caches are
+    # checked against them on every read.
+    _cache_key: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     ## MAGIC METHODS ##
 
     def __post_init__(self):
         assert self.modulus > 0, "Modulus must be a positive integer."
-        assert self.pitch_classes == list(
-            sorted(self.pitch_classes)
-        ), "Pitch classes must be in order."
-        assert len(self.pitch_classes) == len(
-            set(self.pitch_classes)
-        ), "Pitch classes must be unique."
+        # Strictly ascending implies both sorted and unique, and then only the
+        # ends need checking against the modulus.
         assert all(
-            [0 <= pitch < self.modulus for pitch in self.pitch_classes]
+            a < b for a, b in pairwise(self.pitch_classes)
+        ), "Pitch classes must be in order and unique."
+        assert not self.pitch_classes or (
+            0 <= self.pitch_classes[0] and self.pitch_classes[-1] < self.modulus
         ), "Pitch classes must be between 0 and modulus - 1."
         if self.root is not None:
             assert self.root in self.pitch_classes, "Root must be in pitch class set."
 
+    @classmethod
+    def _unchecked(
+        cls, pitch_classes: list[int], modulus: int, root: Optional[int] = None
+    ) -> PitchClassSet:
+        """Constructs a pitch class set without validating it. Only for callers that
+        already guarantee the pitch classes are sorted, unique and in range."""
+
+        pcset = cls.__new__(cls)
+        pcset.pitch_classes = pitch_classes
+        pcset.modulus = modulus
+        pcset.root = root
+        pcset._pc_index = None
+        pcset._bitmask = None
+        pcset._interval_vector = None
+        pcset._structure = None
+        pcset._cache_key = None
+
+        return pcset
+
     def __getitem__(self, item: int | slice) -> int | list[int]:
         if isinstance(item, int):
             return self.pitch_classes[item]
@@ -89,7 +133,7 @@ class PitchClassSet:
         if self.root is None:
             return
 
-        i = (self.pitch_classes.index(self.root) + amount) % self.cardinality
+        i = (self._indices()[self.root] + amount) % self.cardinality
         self.root = self.pitch_classes[i]
 
     def rotate_mode_parallel(self, amount: int):
@@ -107,24 +151,48 @@ class PitchClassSet:
         structure.rotate(amount)
         new_pcset = structure.stamp_to_pcset_with_root(self.root)
         self.pitch_classes = new_pcset.pitch_classes
+        # Read from the root, the new pitch classes have the rotated structure.
+        self._check_caches()
+        self._structure = structure
 
     def transpose(self, amount: int):
         """Transposes the pitch classes in the set using modular arithmetic."""
 
-        self.pitch_classes = [(pc + amount) % self.modulus for pc in self.pitch_classes]
-        self.pitch_classes.sort()
+        self._check_caches()
+        bitmask = self._bitmask
+        interval_vector = self._interval_vector
+
+        self.pitch_classes = self._transposed_pitch_classes(amount)
         if self.root is not None:
             self.root = (self.root + amount) % self.modulus
 
+        # Transposing rotates the mask within the modulus, and doesn't change the
+        # interval vector, so those carry over.
+        self._check_caches()
+        if bitmask is not None:
+            shift = amount % self.modulus
+            mask = bitmask << shift
+            self._bitmask = (mask | mask >> self.modulus) & ((1 << self.modulus) - 1)
+        self._interval_vector = interval_vector
+
     def transposed(self, amount: int) -> PitchClassSet:
         """Returns a transposed pitch class set."""
 
-        pitch_classes = [(pc + amount) % self.modulus for pc in self.pitch_classes]
-        pitch_classes.sort()
+        root = None
         if self.root is not None:
             root = (self.root + amount) % self.modulus
 
-        return PitchClassSet(pitch_classes, self.modulus, root)
+        return PitchClassSet(self._transposed_pitch_classes(amount), self.modulus, root)
+
+    def _transposed_pitch_classes(self, amount: int) -> list[int]:
+        # Transposing a sorted set rotates it: the pitch classes that wrap past the
+        # modulus move to the front, so no sort is needed.
+        shift = amount % self.modulus
+        split = bisect_left(self.pitch_classes, self.modulus - shift)
+
+        return [pc + shift - self.modulus for pc in self.pitch_classes[split:]] + [
+            pc + shift for pc in self.pitch_classes[:split]
+        ]
 
     def normalize(self, pitch_class: int):
         """Transposes the pitch classes in the set so 0 is present."""
@@ -145,9 +213,11 @@ class PitchClassSet:
     def index(self, pitch_class: int) -> int:
         """Returns the index of a pitch class."""
 
-        assert pitch_class in self.pitch_classes, "Pitch class must be in set."
+        indices = self._indices()
+
+        assert pitch_class in indices, "Pitch class must be in set."
 
-        return self.pitch_classes.index(pitch_class)
+        return indices[pitch_class]
 
     def scale_function(self, root: int) -> ScaleFunc:
         """Returns a scale function that maps to the same pitches as this pitch class set.
@@ -158,13 +228,29 @@ class PitchClassSet:
 
         return ScaleFunc(
             self.normalized(root).pitch_classes[1:] + [self.modulus],
-            min(self.pitch_classes),
+            self.pitch_classes[0],
         )
 
     def contains(self, pitch: int) -> bool:
         """Returns true if a pitch belongs to a pitch class in the set."""
 
-        return True if pitch % self.modulus in self.pitch_classes else False
+        return pitch % self.modulus in self._indices()
+
+    def _as_bitmask(self) -> int:
+        self._check_caches()
+
+        if self._bitmask is None:
+            self._bitmask = sum(1 << pc for pc in self.pitch_classes)
+
+        return self._bitmask
+
+    def _indices(self) -> dict[int, int]:
+        self._check_caches()
+
+        if self._pc_index is None:
+            self._pc_index = {pc: i for i, pc in enumerate(self.pitch_classes)}
+
+        return self._pc_index
 
     @property
     def interval_spectrum(self) -> list[list[int]]:
@@ -186,17 +272,16 @@ class PitchClassSet:
         if self.cardinality <= 1:
             return []
 
-        spectrum: list[list[int]] = []
+        pitch_classes = self.pitch_classes
 
-        for jump in range(1, self.cardinality):
-            diff: list[int] = []
-            for pos in range(self.cardinality):
-                index = (pos + jump) % self.cardinality
-                interval = self.pitch_classes[index] - self.pitch_classes[pos]
-                diff.append(interval % self.modulus)
-            spectrum.append(diff)
+        # Continuing the sorted pitch classes into the next octave makes every
+        # difference already reduced, so each row is one zip with no modulo.
+        wrapped = pitch_classes + [pc + self.modulus for pc in pitch_classes]
 
-        return spectrum
+        return [
+            [high - low for low, high in zip(pitch_classes, wrapped[jump:])]
+            for jump in range(1, self.cardinality)
+        ]
 
     @property
     def interval_vector(self) -> tuple[int, ...]:
@@ -206,18 +291,27 @@ class PitchClassSet:
         classes in the set. There are `floor(m/2)` interval classes in a pitch class
         set with a modulus of `m`."""
 
-        iclass_count: int = math.floor(self.modulus / 2)
-        vector: list[int] = [0] * iclass_count
+        self._check_caches()
 
-        iclasses = [
-            harmonic_interval_class(pair[0], pair[1], self.modulus)
-            for pair in list(combinations(self.pitch_classes, 2))
-        ]
+        if self._interval_vector is None:
+            modulus = self.modulus
+            mask = self._as_bitmask()
 
-        for iclass in iclasses:
-            vector[iclass - 1] += 1
+            # Rotating the mask down by `interval` lines each pitch class up with
+            # the one that far above it, so the overlap counts the pairs in that
+            # interval class.
+            vector = [
+                (mask & (mask >> interval | mask << (modulus - interval))).bit_count()
+                for interval in range(1, modulus // 2 + 1)
+            ]
 
-        return tuple(vector)
+            # With an even modulus, the half-modulus class counts each pair twice.
+            if modulus % 2 == 0:
+                vector[-1] //= 2
+
+            self._interval_vector = tuple(vector)
+
+        return self._interval_vector
 
     @property
     def cardinality(self) -> int:
@@ -230,31 +324,59 @@ class PitchClassSet:
         """Returns the intervallic structure of the pitch class set, by default starting
         from the lowest pitch class in the set."""
 
-        index = 0
-
-        if self.root is not None:
-            index = self.pitch_classes.index(self.root)
-
-        intervals = cycle_diff(self.pitch_classes, self.modulus, index)
-
-        return ScaleStructure(intervals)
+        return ScaleStructure(list(self._cached_structure().intervals))
 
     @property
     def prime(self) -> PitchClassSet:
         """Returns the prime subscale of the pitch class set, which has an aperiodic
         structure."""
 
-        root = self.pitch_classes[0]
+        # The repeating unit is cached on the cached structure, so it is found once
+        # and reused for both the root and the stamp.
+        unit = self._cached_structure()._repeating_unit()
+        modulus = sum(unit)
 
-        if self.root is not None:
-            root_index = self.pitch_classes.index(self.root)
-            prime_len = self.structure.prime.size
-            root = self.pitch_classes[root_index % prime_len]
+        if self.root is None:
+            start = self.pitch_classes[0]
+            root = None
+        else:
+            start = self.pitch_classes[self._indices()[self.root] % len(unit)]
+            root = start % modulus
+
+        # Stamping positive intervals that sum to the modulus yields sorted, unique
+        # pitch classes, so the result needs no validation.
+        return PitchClassSet._unchecked(cycle_cumsum(unit, start), modulus, root)
+
+    def _cached_structure(self) -> ScaleStructure:
+        self._check_caches()
+
+        if self._structure is None:
+            index = 0
+
+            if self.root is not None:
+                index = self._indices()[self.root]
+
+            self._structure = ScaleStructure(
+                cycle_diff(self.pitch_classes, self.modulus, index)
+            )
 
-        return self.structure.prime.stamp_to_pcset(root)
+        return self._structure
 
+    def _check_caches(self):
+        """Drops the cached lookups if the pitch classes, root or modulus have
+        changed since they were computed."""
 
-@dataclass
+        key = (tuple(self.pitch_classes), self.root, self.modulus)
+
+        if key != self._cache_key:
+            self._cache_key = key
+            self._pc_index = None
+            self._bitmask = None
+            self._interval_vector = None
+            self._structure = None
+
+
+@dataclass(slots=True)
 class ScaleStructure:
     """A sequence of intervals that describes the circular intervallic
     structure of a pitch class set."""
@@ -263,11 +385,16 @@ class ScaleStructure:
 
     intervals: list[int]
 
+    # Lazily computed repeating unit of the intervals. Cleared by rotate.
+    _repeating_subseq: Optional[list[int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     ## MAGIC METHODS ##
 
     def __post_init__(self):
         assert all(
-            [0 < interval for interval in self.intervals]
+            0 < interval for interval in self.intervals
         ), "Intervals in scale structure must be positive."
 
     def __getitem__(self, item: int | slice) -> None | int | list[int]:
@@ -283,6 +410,7 @@ class ScaleStructure:
         """Rotates the intervals in the structure."""
 
         self.intervals = rotate(self.intervals, amount)
+        self._repeating_subseq = None
 
     ## GENERATE ##
 
@@ -313,20 +441,26 @@ class ScaleStructure:
         """Counts the number of unique transpositions that a scale with this
         structure would have."""
 
-        return sum(repeating_subseq(self.intervals))
+        return sum(self._repeating_unit())
 
     def count_modes(self) -> int:
         """Counts the number of distinct modes that a scale with this structure
         would have."""
 
-        return len(repeating_subseq(self.intervals))
+        return len(self._repeating_unit())
 
     @property
     def prime(self) -> ScaleStructure:
         """Returns the structure of the prime subscale. For example, if the structure
         is [2,1,2,1,2,1,2,1], then its prime is [2,1]."""
 
-        return ScaleStructure(repeating_subseq(self.intervals))
+        return ScaleStructure(list(self._repeating_unit()))
+
+    def _repeating_unit(self) -> list[int]:
+        if self._repeating_subseq is None:
+            self._repeating_subseq = repeating_subseq(self.intervals)
+
+        return self._repeating_subseq
 
     @property
     def size(self) -> int:
@@ -341,7 +475,7 @@ class ScaleStructure:
         return sum(self.intervals)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScaleFunc:
     """A scale function is a pattern of coefficients along with a transposition
     which models a scale, such as C major or Gb mixolydian.
@@ -369,17 +503,38 @@ class ScaleFunc:
     pattern: list[int]
     transposition: int = 0
 
+    # The pattern the caches below were derived from. The pattern is a public list
+    # that can be reassigned or edited in place, so the caches are checked against
+    # it on every read.
+    _cached_pattern: Optional[tuple[int, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Residue map and the position of each residue in it.
+    _rmap_cache: Optional[list[int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _rmap_index: Optional[dict[int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Untransposed evaluator specialized to the pattern.
+    _eval_fn: Optional[Callable[[int], int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Structure derived from the pattern, kept private since structures are mutable.
+    _structure: Optional[ScaleStructure] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     ## MAGIC METHODS ##
 
     def __post_init__(self):
-        assert len(set(self.pattern)) == len(
-            self.pattern
-        ), "Elements of pattern must be unique."
-        assert self.pattern == sorted(
-            self.pattern
-        ), "Elements of pattern must be in ascending order."
+        # Strictly ascending implies unique, and then only the first element
+        # needs checking for positivity.
         assert all(
-            [harmonic > 0 for harmonic in self.pattern]
+            a < b for a, b in pairwise(self.pattern)
+        ), "Elements of pattern must be unique and in ascending order."
+        assert (
+            not self.pattern or self.pattern[0] > 0
         ), "Elements of pattern must be greater than 0."
 
     @overload
@@ -404,10 +559,13 @@ class ScaleFunc:
     def rotate_mode_parallel(self, amount: int):
         """Rotates to a parallel mode, retaining the current transposition."""
 
-        sub = self._rmap[amount % self.cardinality]
-        new_pattern = [(pitch_class - sub) % self.modulus for pitch_class in self._rmap]
+        rmap = self._rmap
+        modulus = self.modulus
+
+        sub = rmap[amount % len(rmap)]
+        new_pattern = [(pitch_class - sub) % modulus for pitch_class in rmap]
         new_pattern.sort()
-        self.pattern = new_pattern[1:] + [self.modulus]
+        self.pattern = new_pattern[1:] + [modulus]
 
     def rotate_mode_relative(self, amount: int):
         """Rotates to a relative mode, changing the transposition."""
@@ -445,7 +603,7 @@ class ScaleFunc:
     def to_pcset(self) -> PitchClassSet:
         """Returns the pitch class set corresponding to this scale function."""
 
-        return self.structure.stamp_to_pcset(self.transposition)
+        return self._cached_structure().stamp_to_pcset(self.transposition)
 
     ## ANALYZE ##
 
@@ -472,33 +630,61 @@ class ScaleFunc:
 
         if isinstance(n, int):
             return self._eval(n)
+        if isinstance(n, range) and n.step == 1 and n:
+            return eval_range(
+                self._rmap, self.modulus, self.transposition, n.start, n.stop
+            )
         if isinstance(n, Iterable):
-            return [self._eval(i) for i in n]
+            # Look everything up once, and inline the arithmetic rather than
+            # calling the single-input evaluator per element.
+            rmap = self._rmap
+            cardinality = self.cardinality
+            modulus = self.modulus
+            transposition = self.transposition
+
+            return [
+                (i // cardinality) * modulus + rmap[i % cardinality] + transposition
+                for i in n
+            ]
         return None
 
     def _eval(self, n: int) -> int:
-        r = n % len(self.pattern)
-        q = int((n - r)) / self.cardinality
+        return self._evaluator()(n) + self.transposition
+
+    def _evaluator(self) -> Callable[[int], int]:
+        self._check_caches()
+
+        if self._eval_fn is None:
+            self._eval_fn = compile_eval(
+                tuple(self._rmap), self.cardinality, self.modulus
+            )
 
-        # Returns quotient * modulus + remainder + transposition
-        return int(q * self.modulus + self._rmap[r]) + self.transposition
+        return self._eval_fn
 
     def count_transpositions(self) -> int:
         """Counts the number of unique transpositions of this scale function."""
 
-        return self.structure.count_transpositions()
+        return self._cached_structure().count_transpositions()
 
     def count_modes(self) -> int:
         """Counts the number of distinct modes of this scale function."""
 
-        return self.structure.count_modes()
+        return self._cached_structure().count_modes()
 
     def maps_to_pitch(self, pitch: int) -> bool:
         """Returns true if this scale function has an input that maps to `pitch`."""
 
         r = (pitch - self.transposition) % self.modulus
 
-        return True if r in self._rmap else False
+        return r in self._residue_indices()
+
+    def _residue_indices(self) -> dict[int, int]:
+        self._check_caches()
+
+        if self._rmap_index is None:
+            self._rmap_index = {r: i for i, r in enumerate(self._rmap)}
+
+        return self._rmap_index
 
     @overload
     def index(self, pitch: int) -> int: ...
@@ -521,12 +707,12 @@ class ScaleFunc:
         return None
 
     def _index(self, pitch: int) -> int:
-        assert self.maps_to_pitch(pitch), "Scale function must map to pitch."
-        r = (pitch - self.transposition) % self.modulus
+        q, r = divmod(pitch - self.transposition, self.modulus)
+        indices = self._residue_indices()
 
-        return self._rmap.index(r) + (
-            ((pitch - self.transposition) // self.modulus) * self.cardinality
-        )
+        assert r in indices, "Scale function must map to pitch."
+
+        return q * len(indices) + indices[r]
 
     @property
     def modulus(self) -> int:
@@ -544,17 +730,47 @@ class ScaleFunc:
     def structure(self) -> ScaleStructure:
         """Returns the structure of the corresponding scale."""
 
-        return ScaleStructure(cycle_diff(self._rmap, self.modulus, 0))
+        return ScaleStructure(list(self._cached_structure().intervals))
+
+    def _cached_structure(self) -> ScaleStructure:
+        self._check_caches()
+
+        if self._structure is None:
+            # The residue map starts at 0 and wraps at the modulus, the last element
+            # of the pattern, so its cyclic diff is just the diff of 0 + pattern.
+            self._structure = ScaleStructure(diff([0] + self.pattern))
+
+        return self._structure
 
     @property
     def _rmap(self) -> list[int]:  # residue map
-        return [0] + self.pattern[:-1]
+        self._check_caches()
+
+        if self._rmap_cache is None:
+            self._rmap_cache = [0] + self.pattern[:-1]
+
+        return self._rmap_cache
+
+    def _check_caches(self):
+        """Drops the caches derived from the pattern if the pattern has changed
+        since they were built."""
+
+        pattern = tuple(self.pattern)
+
+        if pattern != self._cached_pattern:
+            self._cached_pattern = pattern
+            self._rmap_cache = None
+            self._rmap_index = None
+            self._eval_fn = None
+            self._structure = None
 
 
 def normalize_interval(interval: int, mod: int) -> int:
     """Converts a member of an interval class to its smallest representative."""
 
-    return interval if interval < mod - interval else mod - interval
+    complement = mod - interval
+
+    return interval if interval < complement else complement
 
 
 def melodic_interval_class(pclass1: int, pclass2: int, modulus: int) -> int:
@@ -566,6 +782,8 @@ def melodic_interval_class(pclass1: int, pclass2: int, modulus: int) -> int:
 def harmonic_interval_class(pclass1: int, pclass2: int, modulus: int) -> int:
     """Returns the harmonic interval class between two pitch classes."""
 
-    return normalize_interval(
-        melodic_interval_class(pclass1, pclass2, modulus), modulus
-    )
+    # Same as normalizing the melodic interval class, without the two calls.
+    interval = (pclass2 - pclass1) % modulus
+    complement = modulus - interval
+
+    return interval if interval < complement else complement
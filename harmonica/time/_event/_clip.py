@@ -105,7 +105,7 @@ class Clip(Generic[E], Event):
         mid.tracks[0].append(MetaMessage("set_tempo", tempo=bpm2tempo(tempo)))
 
         # If there are any drum clips present, create a drum track at index 1 and combine the clips
-        if any([type(event) is DrumClip for event in self.events]):
+        if any(type(event) is DrumClip for event in self.events):
             mid.tracks.append(MidiTrack())
 
             DUR = 40  # Give all drum hits a constant gate value
@@ -1,4 +1,6 @@
+from fractions import Fraction
 from itertools import cycle
+import math
 from typing import Optional
 
 from harmonica.pitch import PitchSet
@@ -33,25 +35,30 @@ def block_chords(
     note_len: A fixed length for each note. If None, then the note lengths are legato - meaning
     notes will be sustained until the next chord begins.
     """
-    assert all([delta >= 0 for delta in delta_seq]), "Deltas must be positive values."
+    assert all(delta >= 0 for delta in delta_seq), "Deltas must be positive values."
     assert clip_dur >= 0, "Clip duration must be positive."
 
     notes = []
 
-    chords = cycle(pset_seq)
-    deltas = cycle(delta_seq)
-    vels = cycle(vel_seq)
+    # Work in integer ticks so the loops add ints instead of fractions.
+    scale = _tick_scale(clip_dur, strum, *delta_seq, *([note_len] if note_len else []))
+    clip_ticks = _to_ticks(clip_dur, scale)
+    strum_ticks = _to_ticks(strum, scale)
 
-    onset = Mixed(0)
+    # Draw chord, delta and velocity together in one step per chord.
+    steps = zip(
+        cycle(pset_seq),
+        cycle([_to_ticks(delta, scale) for delta in delta_seq]),
+        cycle(vel_seq),
+    )
+    append = notes.append
 
-    if not note_len:
-        while True:
-            if onset >= clip_dur:
-                return NoteClip(notes)
+    onset = 0
 
-            chord = next(chords)
-            delta = next(deltas)
-            vel = next(vels)
+    if not note_len:
+        for chord, delta, vel in steps:
+            if onset >= clip_ticks:
+                break
 
             strum_onset = onset
             strum_dur = delta
@@ -59,51 +66,51 @@ def block_chords(
             for pitch in chord:
                 dur = strum_dur
                 if trim_end:
-                    dur = min(dur, clip_dur - strum_onset)
+                    dur = min(dur, clip_ticks - strum_onset)
                 if strum_dur > 0:
-                    notes.append(
+                    append(
                         Note(
-                            onset=strum_onset,
+                            onset=_from_ticks(strum_onset, scale),
                             pitch=pitch,
-                            duration=dur,
+                            duration=_from_ticks(dur, scale),
                             velocity=vel,
                         )
                     )
-                    strum_dur -= strum
-                    strum_onset += strum
+                    strum_dur -= strum_ticks
+                    strum_onset += strum_ticks
                 else:
                     break
 
             onset += delta
     else:
-        while True:
-            if onset >= clip_dur:
-                return NoteClip(notes)
+        len_ticks = _to_ticks(note_len, scale)
 
-            chord = next(chords)
-            delta = next(deltas)
-            vel = next(vels)
+        for chord, delta, vel in steps:
+            if onset >= clip_ticks:
+                break
 
             strum_onset = onset
 
             for pitch in chord:
-                dur = note_len
+                dur = len_ticks
                 if trim_end:
-                    dur = min(dur, clip_dur - strum_onset)
+                    dur = min(dur, clip_ticks - strum_onset)
                 if strum_onset - onset >= delta:
                     break
-                notes.append(
+                append(
                     Note(
-                        onset=strum_onset,
+                        onset=_from_ticks(strum_onset, scale),
                         pitch=pitch,
-                        duration=dur,
+                        duration=_from_ticks(dur, scale),
                         velocity=vel,
                     )
                 )
-                strum_onset += strum
+                strum_onset += strum_ticks
 
             onset += delta
 
+    return NoteClip(notes)
+
 
 def mono_line(
     pitch_seq: list[int],
@@ -124,29 +131,65 @@ def mono_line(
     note_len: A fixed length for each note. If None, then the note lengths are legato - meaning
     notes will be sustained until the next note begins."""
 
-    assert all([delta >= 0 for delta in delta_seq]), "Deltas must be positive values."
+    assert all(delta >= 0 for delta in delta_seq), "Deltas must be positive values."
     assert clip_dur >= 0, "Clip duration must be positive."
 
     notes = []
 
-    pitches = cycle(pitch_seq)
-    deltas = cycle(delta_seq)
-    vels = cycle(vel_seq)
-    onset = Mixed(0)
+    # Work in integer ticks so the loop adds ints instead of fractions.
+    scale = _tick_scale(clip_dur, *delta_seq, *([note_len] if note_len else []))
+    clip_ticks = _to_ticks(clip_dur, scale)
+    len_ticks = _to_ticks(note_len, scale) if note_len else 0
 
-    while True:
-        if onset >= clip_dur:
-            return NoteClip(notes)
+    steps = zip(
+        cycle(pitch_seq),
+        cycle([_to_ticks(delta, scale) for delta in delta_seq]),
+        cycle(vel_seq),
+    )
+    append = notes.append
+    onset = 0
 
-        delta = next(deltas)
-        vel = next(vels)
-        p = next(pitches)
+    for p, delta, vel in steps:
+        if onset >= clip_ticks:
+            break
 
-        dur = note_len if note_len else delta
+        dur = len_ticks if len_ticks else delta
 
         if trim_end:
-            dur = min(dur, clip_dur - onset)
+            dur = min(dur, clip_ticks - onset)
 
-        notes.append(Note(onset=onset, pitch=p, duration=dur, velocity=vel))
+        append(
+            Note(
+                onset=_from_ticks(onset, scale),
+                pitch=p,
+                duration=_from_ticks(dur, scale),
+                velocity=vel,
+            )
+        )
 
         onset += delta
+
+    return NoteClip(notes)
+
+
+def _tick_scale(*values: Mixed) -> int:
+    """Returns the number of ticks per unit of time that makes every value a whole
+    number of ticks."""
+
+    return math.lcm(*(Fraction(value).denominator for value in values))
+
+
+def _to_ticks(value: Mixed, scale: int) -> int:
+    """Converts a time value to a whole number of ticks at the given scale."""
+
+    frac = Fraction(value)
+
+    return frac.numerator * (scale // frac.denominator)
+
+
+def _from_ticks(ticks: int, scale: int) -> Mixed:
+    """Converts a whole number of ticks at the given scale back to a time value."""
+
+    # Fraction's constructor reduces a pair of ints in one gcd. Going through it
+    # directly skips Mixed's checks for string, float and Fraction arguments.
+    return Fraction.__new__(Mixed, ticks, scale)
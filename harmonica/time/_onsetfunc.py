@@ -28,7 +28,7 @@ class OnsetFunc:
             self.pattern
         ), "Elements of pattern must be in ascending order."
         assert all(
-            [harmonic > 0 for harmonic in self.pattern]
+            harmonic > 0 for harmonic in self.pattern
         ), "Elements of pattern must be greater than 0."
 
     def __call__(self, n):
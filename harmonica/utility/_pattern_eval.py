@@ -0,0 +1,53 @@
+"""Evaluation of periodic pitch patterns, shared by scale functions and pitch
+functions."""
+
+from typing import Callable
+
+
+def compile_eval(
+    rmap: tuple[int, ...], cardinality: int, modulus: int
+) -> Callable[[int], int]:
+    """Builds an evaluator for a pattern, with its residue map, cardinality and
+    modulus bound as constants. Returns quotient * modulus + residue, leaving the
+    transposition to the caller."""
+
+    if cardinality & (cardinality - 1) == 0:
+        # A power of two divides by shifting and masking. The shift floors for
+        # negative inputs just like divmod does.
+        shift = cardinality.bit_length() - 1
+        mask = cardinality - 1
+
+        def evaluate(n: int) -> int:
+            return (n >> shift) * modulus + rmap[n & mask]
+
+    else:
+
+        def evaluate(n: int) -> int:
+            q, r = divmod(n, cardinality)
+            return q * modulus + rmap[r]
+
+    return evaluate
+
+
+def eval_range(
+    rmap: list[int] | tuple[int, ...],
+    modulus: int,
+    transposition: int,
+    start: int,
+    stop: int,
+) -> list[int]:
+    """Evaluates a pattern, given by its residue map, at every integer from `start`
+    up to but not including `stop`. The range must not be empty."""
+
+    period = len(rmap)
+    row = [offset + transposition for offset in rmap]
+
+    # A run of consecutive inputs covers whole periods, each of which is the
+    # first period shifted by a multiple of the modulus. Tile those periods,
+    # then trim the partial ones off the ends.
+    first_q, first_r = divmod(start, period)
+    last_q, last_r = divmod(stop, period)
+    shifts = [q * modulus for q in range(first_q, last_q + 1)]
+    pitches = [shift + pitch for shift in shifts for pitch in row]
+
+    return pitches[first_r : len(pitches) - period + last_r]
@@ -1,7 +1,7 @@
 """Miscellaneous functions that are helpful throughout the library."""
 
 import math
-from itertools import chain, combinations
+from itertools import accumulate, chain, combinations, pairwise
 from typing import Iterable
 
 __all__ = [
@@ -60,7 +60,9 @@ def int_to_pitch_class(pitch_int: int) -> str:
 def rotate(lst: list, n: int) -> list:
     """Returns a rotated list."""
 
-    return lst[n % len(lst) :] + lst[: n % len(lst)]
+    split = n % len(lst)
+
+    return lst[split:] + lst[:split]
 
 
 def brightness_of_tone(tone: int) -> int:
@@ -101,7 +103,7 @@ def brightness_of_tone(tone: int) -> int:
 def diff(seq: list[int]) -> list[int]:
     """Diffs a sequence of numbers."""
 
-    return [seq[i + 1] - seq[i] for i in range(len(seq) - 1)]
+    return [b - a for a, b in pairwise(seq)]
 
 
 def cycle_diff(cycle: list[int], mod: int, start_index: int) -> list[int]:
@@ -119,11 +121,7 @@ def cycle_diff(cycle: list[int], mod: int, start_index: int) -> list[int]:
 def cumsum(seq: list[int], start: int = 0) -> list[int]:
     """Gives the cumulative sum of a sequence (opposite of diff)."""
 
-    cs = [start]
-    for num in seq:
-        cs += [cs[-1] + num]
-
-    return cs
+    return list(accumulate(seq, initial=start))
 
 
 def cycle_cumsum(cycle: list[int], start: int) -> list[int]:
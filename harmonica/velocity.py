@@ -17,7 +17,7 @@ class VelocityFunc:
 
     def __post_init__(self):
         assert all(
-            [velocity_index >= 0 for velocity_index in self.pattern]
+            velocity_index >= 0 for velocity_index in self.pattern
         ), "Numbers in pattern must be positive."
 
         assert self.resolution > 0, "Time resolution must be positive."
@@ -38,6 +38,18 @@ class TestPitchSet:
         shape = PitchSetShape([4, 3, 4])
         assert pset.shape == shape
 
+    def test_edit_pitches_in_place(self):
+        pset = PitchSet([0, 4, 7])
+        assert pset in {PitchSet([0, 4, 7])}
+        assert pset.shape == PitchSetShape([4, 3])
+        pset.pitches[0] = 1
+        assert pset in {PitchSet([1, 4, 7])}
+        assert pset.shape == PitchSetShape([3, 3])
+
+    def test_shape_not_shared(self):
+        PitchSet([0, 4, 7]).shape.intervals[0] = 3
+        assert PitchSet([2, 6, 9]).shape == PitchSetShape([4, 3])
+
     def test_classify(self):
         pset = PitchSet([0, 2, 4, 9, 11, 16])
         mod = 8
@@ -57,6 +69,11 @@ class TestPitchSet:
         spectrum = [[4, 3, 7], [7, 10], [14]]
         assert pset.interval_spectrum == spectrum
 
+    def test_interval_spectrum_not_shared(self):
+        pset = PitchSet([0, 4, 7])
+        pset.interval_spectrum[0].append(99)
+        assert (pset + 2).interval_spectrum == [[4, 3], [7]]
+
     def test_invert(self):
         pset = PitchSet([4, 6, 9, 13])
         amount = 3
@@ -0,0 +1,93 @@
+from harmonica.find import FindPitchSets, find_pcset_supersets
+from harmonica.pitch import PitchClassSet, PitchSet, PitchSetShape
+
+
+class TestFindPitchSets:
+    def test_cardinality(self):
+        results = FindPitchSets(0, 4).cardinality(2).collect_list()
+        assert len(results) == 10 and all(pset.cardinality == 2 for pset in results)
+
+    def test_max_cardinality(self):
+        results = FindPitchSets(0, 3).max_cardinality(2).collect_list()
+        assert len(results) == 10 and all(pset.cardinality <= 2 for pset in results)
+
+    def test_collect_is_lazy(self):
+        results = FindPitchSets(0, 60).cardinality(1).collect()
+        assert next(results) == PitchSet([0])
+
+    def test_in_pcset(self):
+        pcset = PitchClassSet([0, 4, 7], 12)
+        results = FindPitchSets(0, 12).in_pcset(pcset).cardinality(3).collect()
+        assert set(results) == {
+            PitchSet([0, 4, 7]),
+            PitchSet([0, 4, 12]),
+            PitchSet([0, 7, 12]),
+            PitchSet([4, 7, 12]),
+        }
+
+    def test_has_shape(self):
+        results = FindPitchSets(0, 10).has_shape(PitchSetShape([4, 3])).collect()
+        assert set(results) == {
+            PitchSet([0, 4, 7]),
+            PitchSet([1, 5, 8]),
+            PitchSet([2, 6, 9]),
+            PitchSet([3, 7, 10]),
+        }
+
+    def test_has_shape_in_pcset(self):
+        pcset = PitchClassSet([0, 2, 4, 5, 7, 9, 11], 12)
+        results = (
+            FindPitchSets(0, 12)
+            .has_shape(PitchSetShape([4, 3]))
+            .in_pcset(pcset)
+            .collect()
+        )
+        assert set(results) == {PitchSet([0, 4, 7]), PitchSet([5, 9, 12])}
+
+    def test_collect_list_repeated(self):
+        finder = FindPitchSets(0, 6).cardinality(3)
+        first = finder.collect_list()
+        first[0].transpose(1)
+        second = finder.collect_list()
+        assert len(second) == 35 and second[0] != first[0]
+
+    def test_collect_list_after_editing_pcset(self):
+        pcset = PitchClassSet([0, 4, 7], 12)
+        finder = FindPitchSets(0, 12).in_pcset(pcset).cardinality(3)
+        first = finder.collect_list()
+        pcset.pitch_classes.append(9)
+        assert finder.collect_list() == first
+        finder.in_pcset(pcset)
+        assert len(finder.collect_list()) == 10
+
+    def test_has_subshape(self):
+        results = FindPitchSets(0, 5).has_subshape(PitchSetShape([2, 2])).collect()
+        assert set(results) == {
+            PitchSet([0, 2, 4]),
+            PitchSet([1, 3, 5]),
+            PitchSet([0, 1, 2, 4]),
+            PitchSet([0, 2, 3, 4]),
+            PitchSet([0, 2, 4, 5]),
+            PitchSet([0, 1, 3, 5]),
+            PitchSet([1, 2, 3, 5]),
+            PitchSet([1, 3, 4, 5]),
+            PitchSet([0, 1, 2, 3, 4]),
+            PitchSet([0, 1, 2, 4, 5]),
+            PitchSet([0, 2, 3, 4, 5]),
+            PitchSet([0, 1, 2, 3, 5]),
+            PitchSet([0, 1, 3, 4, 5]),
+            PitchSet([1, 2, 3, 4, 5]),
+            PitchSet([0, 1, 2, 3, 4, 5]),
+        }
+
+
+class TestFindPCSetSupersets:
+    def test_supersets(self):
+        pcset = PitchClassSet([0, 2], 4)
+        results = find_pcset_supersets(pcset)
+        assert [superset.pitch_classes for superset in results] == [
+            [0, 2],
+            [0, 1, 2],
+            [0, 1, 2, 3],
+            [0, 2, 3],
+        ]
@@ -29,6 +29,12 @@ class TestPitchSeq:
         pseq = PitchSeq([5, 7, 4, 5, 5, 11])
         assert shape.stamp(5) == pseq
 
+    def test_stamp_keeps_own_shape(self):
+        shape = PitchSeqShape([2, 2])
+        pseq = shape.stamp(60)
+        shape.intervals.append(5)
+        assert pseq.shape == PitchSeqShape([2, 2])
+
 
 class TestPSeqSet:
     def test_all_lengths_equal(self):
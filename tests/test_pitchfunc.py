@@ -0,0 +1,23 @@
+from harmonica.pitch import PitchFunc
+
+
+class TestPitchFunc:
+    def test_in_range(self):
+        func = PitchFunc([2, 4, 5, 7, 9, 11, 12], 2)
+        assert func.in_range(0, 14) == [1, 2, 4, 6, 7, 9, 11, 13, 14]
+
+    def test_in_range_below_transposition(self):
+        func = PitchFunc([2, 4, 5, 7, 9, 11, 12], 2)
+        assert func.in_range(-5, 2) == [-5, -3, -1, 1, 2]
+
+    def test_eval_range(self):
+        func = PitchFunc([2, 4, 5, 7, 9, 11, 12], 2)
+        assert func.eval(range(-2, 9)) == func.eval(list(range(-2, 9)))
+
+    def test_edit_pattern(self):
+        func = PitchFunc([2, 4, 12])
+        assert func(1) == 2
+        func.pattern[0] = 3
+        assert func(1) == 3
+        func.pattern = [5, 12]
+        assert func(range(3)) == [0, 5, 12]
@@ -55,6 +55,18 @@ class TestPitchClassSet:
         prime = PitchClassSet([0, 2], 3)
         assert scale.prime == prime
 
+    def test_edit_pitch_classes_in_place(self):
+        scale = PitchClassSet([0, 2, 4, 5, 7, 9, 11], 12)
+        assert scale.contains(13) is False
+        assert scale.interval_vector == (2, 5, 4, 3, 6, 1)
+        assert scale.structure == ScaleStructure([2, 2, 1, 2, 2, 2, 1])
+        scale.pitch_classes[0] = 1
+        assert scale.contains(13) is True
+        assert scale.interval_vector == (2, 5, 4, 4, 4, 2)
+        assert scale.structure == ScaleStructure([1, 2, 1, 2, 2, 2, 2])
+        scale.pitch_classes = [0, 2, 3, 5, 6, 8, 9, 11]
+        assert scale.prime == PitchClassSet([0, 2], 3)
+
 
 class TestPCSetWithRoot:
     def test_structure(self):
@@ -153,6 +165,21 @@ class TestScaleFunc:
         evals = [6, 9, 13]
         assert scale([1, 3, 5]) == evals
 
+    def test_reassign_pattern(self):
+        scale = ScaleFunc([2, 4, 12])
+        scale(range(3))
+        scale.pattern = [3, 7, 12]
+        assert scale(range(6)) == [0, 3, 7, 12, 15, 19] and scale.maps_to_pitch(3)
+        scale.pattern[0] = 2
+        assert scale(1) == 2 and scale.structure == ScaleStructure([2, 5, 5])
+        scale.pattern.append(14)
+        assert scale(range(4)) == [0, 2, 7, 12] and scale.index(16) == 5
+
+    def test_eval_range(self):
+        scale = ScaleFunc([2, 4, 5], 4)
+        evals = [1, 3, 4, 6, 8, 9]
+        assert scale(range(-2, 4)) == evals
+
     def test_composition(self):
         scale1 = ScaleFunc([2, 4, 5, 7, 9, 11, 12], 2)
         scale2 = ScaleFunc([2], 1)